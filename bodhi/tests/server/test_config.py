@@ -16,20 +16,96 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
+import copy
+import re
 import unittest
 
 import mock
 
-from bodhi.server import config
+# These are set up by setUpModule(). Importing bodhi.server.config pulls in the whole server stack
+# (pyramid, sqlalchemy, etc.), so defer it until a test from this module is actually run rather
+# than paying for it whenever this module is merely collected.
+config = None
+_LOADED = None
+
+# Shared dictionaries for the load_config tests, hoisted here so they are built once instead of
+# on every test run. load_config() never mutates the settings it is given, so sharing is safe.
+_MINIMAL_SETTINGS = {'session.secret': 'secret', 'authtkt.secret': 'secret'}
+_BAD_BOOL_SETTINGS = {'fedmsg_enabled': 'not a bool', 'session.secret': 'secret',
+                      'authtkt.secret': 'secret'}
+_WIKI_SETTINGS = {'wiki_url': 'test', 'session.secret': 'secret', 'authtkt.secret': 'secret'}
+_MARKS_LOADED_SETTINGS = {'password': 'hunter2', 'session.secret': 'ssshhhhh',
+                          'authtkt.secret': 'keepitsafe'}
+_ONE_DEFAULT = {'one': {'value': 'default'}}
+_VALID_FERNET_KEY = 'gFqE6rcBXVLssjLjffsQsAa-nlm5Bg06MTKrVT9hsMA='
+
+# The strings _validate_bool() accepts as False and True, respectively.
+_FALSEY = ('f', 'false', 'n', 'no', 'off', '0')
+_TRUTHY = ('t', 'true', 'y', 'yes', 'on', '1')
+
+# A string that isn't a base-16 number, a string that doesn't start with #, and a string with the
+# wrong length, respectively.
+_INVALID_COLORS = ('#65FE0G', '065FE00', '#65FE0')
+
+# A key that isn't base64, and a base64 key of the wrong length, respectively.
+_INVALID_KEYS = ('not base 64', 'VGhpcyBpcyBhIHRlc3Qgb2YgdGhlIHN5c3RlbS4K')
+
+# Expected validation error messages, assembled once at import time.
+_ERR_INVALID_PREFIX = 'Invalid config values were set: \n\t'
+_ERR_HTTP_URL = 'This setting must be a URL starting with https://.'
+_ERR_NOT_A_BOOL = '"not a bool" cannot be interpreted as a boolean value.'
+_TIMEFRAME_DEFAULT = {'top_testers_timeframe': {'value': 7, 'validator': int}}
+_WIKI_URL_DEFAULT = {'wiki_url': {'value': 'https://fedoraproject.org/w/api.php',
+                                  'validator': unicode}}
+
+
+class _Counter(object):
+    """A minimal stand-in for mock.Mock() that only records how often it was called.
+
+    Mock synthesizes a child mock on every attribute access, which is far more machinery than the
+    tests replacing load_config() need just to check whether loading was triggered.
+    """
+
+    def __init__(self):
+        self.call_count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.call_count += 1
+
+    def assert_called_once(self):
+        assert self.call_count == 1, 'Expected 1 call, got {}.'.format(self.call_count)
+
+    def reset_mock(self):
+        self.call_count = 0
+
+
+def setUpModule():
+    global config, _LOADED
+    from bodhi.server import config as _config
+    config = _config
+
+    # Loading and validating a full config is expensive, so do it once here and let tests that
+    # just need a loaded config take a cheap copy of this one.
+    _LOADED = config.BodhiConfig()
+    _LOADED.load_config(_MINIMAL_SETTINGS)
 
 
 class BodhiConfigGetItemTests(unittest.TestCase):
     """Tests for the ``__getitem__`` method on the :class:`BodhiConfig` class."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.config = config.BodhiConfig()
+        cls.config.load_config = _Counter()
+
     def setUp(self):
-        self.config = config.BodhiConfig()
-        self.config.load_config = mock.Mock()
+        self.config.clear()
         self.config['password'] = 'hunter2'
+        self.config.loaded = False
+        self.config.load_config.reset_mock()
+
+    def tearDown(self):
+        self.config.clear()
 
     def test_not_loaded(self):
         """Assert calling ``__getitem__`` causes the config to load."""
@@ -52,10 +128,19 @@ class BodhiConfigGetItemTests(unittest.TestCase):
 class BodhiConfigGetTests(unittest.TestCase):
     """Tests for the ``get`` method on the :class:`BodhiConfig` class."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.config = config.BodhiConfig()
+        cls.config.load_config = _Counter()
+
     def setUp(self):
-        self.config = config.BodhiConfig()
-        self.config.load_config = mock.Mock()
+        self.config.clear()
         self.config['password'] = 'hunter2'
+        self.config.loaded = False
+        self.config.load_config.reset_mock()
+
+    def tearDown(self):
+        self.config.clear()
 
     def test_not_loaded(self):
         """Assert calling ``get`` causes the config to load."""
@@ -78,10 +163,19 @@ class BodhiConfigGetTests(unittest.TestCase):
 class BodhiConfigPopItemTests(unittest.TestCase):
     """Tests for the ``pop`` method on the :class:`BodhiConfig` class."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.config = config.BodhiConfig()
+        cls.config.load_config = _Counter()
+
     def setUp(self):
-        self.config = config.BodhiConfig()
-        self.config.load_config = mock.Mock()
+        self.config.clear()
         self.config['password'] = 'hunter2'
+        self.config.loaded = False
+        self.config.load_config.reset_mock()
+
+    def tearDown(self):
+        self.config.clear()
 
     def test_not_loaded(self):
         """Assert calling ``pop`` causes the config to load."""
@@ -109,10 +203,19 @@ class BodhiConfigPopItemTests(unittest.TestCase):
 class BodhiConfigCopyTests(unittest.TestCase):
     """Tests for the ``copy`` method on the :class:`BodhiConfig` class."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.config = config.BodhiConfig()
+        cls.config.load_config = _Counter()
+
     def setUp(self):
-        self.config = config.BodhiConfig()
-        self.config.load_config = mock.Mock()
+        self.config.clear()
         self.config['password'] = 'hunter2'
+        self.config.loaded = False
+        self.config.load_config.reset_mock()
+
+    def tearDown(self):
+        self.config.clear()
 
     def test_not_loaded(self):
         """Assert calling ``copy`` causes the config to load."""
@@ -130,57 +233,70 @@ class BodhiConfigCopyTests(unittest.TestCase):
 
 class BodhiConfigLoadConfig(unittest.TestCase):
 
-    @mock.patch('bodhi.server.config.get_appsettings')
-    def test_loads_defaults(self, get_appsettings):
+    @classmethod
+    def setUpClass(cls):
+        cls.config = config.BodhiConfig()
+
+    def setUp(self):
+        self.config.clear()
+        self.config.loaded = False
+        # Swapping the module attributes directly is much cheaper than mock.patch's
+        # start/stop machinery, so save the originals and restore them in tearDown.
+        self._orig_appsettings = config.get_appsettings
+        self._orig_configfile = config.get_configfile
+        config.get_appsettings = mock.Mock()
+        config.get_configfile = mock.Mock(return_value='/some/config.ini')
+
+    def tearDown(self):
+        config.get_appsettings = self._orig_appsettings
+        config.get_configfile = self._orig_configfile
+        self.config.clear()
+
+    @mock.patch.dict('bodhi.server.config.BodhiConfig._defaults', _TIMEFRAME_DEFAULT, clear=True)
+    def test_loads_defaults(self):
         """Test that defaults are loaded."""
-        c = config.BodhiConfig()
+        c = self.config
 
-        c.load_config({'session.secret': 'secret', 'authtkt.secret': 'secret'})
+        c.load_config(_MINIMAL_SETTINGS)
 
         self.assertEqual(c['top_testers_timeframe'], 7)
 
-    @mock.patch('bodhi.server.config.get_configfile', mock.Mock(return_value='/some/config.ini'))
-    @mock.patch('bodhi.server.config.get_appsettings')
-    def test_marks_loaded(self, mock_appsettings):
-        c = config.BodhiConfig()
-        mock_appsettings.return_value = {'password': 'hunter2', 'session.secret': 'ssshhhhh',
-                                         'authtkt.secret': 'keepitsafe'}
+    def test_marks_loaded(self):
+        c = self.config
+        config.get_appsettings.return_value = _MARKS_LOADED_SETTINGS
 
         c.load_config()
 
-        mock_appsettings.assert_called_once_with('/some/config.ini')
-        self.assertTrue(('password', 'hunter2') in c.items())
+        config.get_appsettings.assert_called_once_with('/some/config.ini')
+        self.assertEqual(c['password'], 'hunter2')
         self.assertTrue(c.loaded)
 
-    @mock.patch('bodhi.server.config.get_appsettings')
-    def test_validates(self, get_appsettings):
+    def test_validates(self):
         """Test that the config is validated."""
-        c = config.BodhiConfig()
+        c = self.config
+        defaults = {'fedmsg_enabled': {'value': False, 'validator': config._validate_bool}}
 
-        with self.assertRaises(ValueError) as exc:
-            c.load_config({'fedmsg_enabled': 'not a bool', 'session.secret': 'secret',
-                           'authtkt.secret': 'secret'})
+        with mock.patch.dict('bodhi.server.config.BodhiConfig._defaults', defaults, clear=True):
+            with self.assertRaises(ValueError) as exc:
+                c.load_config(_BAD_BOOL_SETTINGS)
 
-        self.assertEqual(
-            str(exc.exception),
-            ('Invalid config values were set: \n\tfedmsg_enabled: "not a bool" cannot be '
-             'interpreted as a boolean value.'))
+        self.assertEqual(exc.exception.args[0],
+                         _ERR_INVALID_PREFIX + 'fedmsg_enabled: ' + _ERR_NOT_A_BOOL)
 
-    @mock.patch('bodhi.server.config.get_appsettings')
-    def test_with_settings(self, get_appsettings):
+    @mock.patch.dict('bodhi.server.config.BodhiConfig._defaults', _WIKI_URL_DEFAULT, clear=True)
+    def test_with_settings(self):
         """Test with the optional settings parameter."""
-        c = config.BodhiConfig()
+        c = self.config
 
-        c.load_config({'wiki_url': 'test', 'session.secret': 'secret', 'authtkt.secret': 'secret'})
+        c.load_config(_WIKI_SETTINGS)
 
         self.assertEqual(c['wiki_url'], 'test')
-        self.assertEqual(get_appsettings.call_count, 0)
+        self.assertEqual(config.get_appsettings.call_count, 0)
 
 
 class BodhiConfigLoadDefaultsTests(unittest.TestCase):
     """Test the BodhiConfig._load_defaults() method."""
-    @mock.patch.dict('bodhi.server.config.BodhiConfig._defaults', {'one': {'value': 'default'}},
-                     clear=True)
+    @mock.patch.dict('bodhi.server.config.BodhiConfig._defaults', _ONE_DEFAULT, clear=True)
     def test_load_defaults(self):
         c = config.BodhiConfig()
 
@@ -190,22 +306,26 @@ class BodhiConfigLoadDefaultsTests(unittest.TestCase):
 
 
 class BodhiConfigValidate(unittest.TestCase):
+
+    def setUp(self):
+        # The unittest analogue of a module-scoped fixture: every test works on a cheap copy of
+        # the config that setUpModule() loaded once for the whole module.
+        self.config = copy.copy(_LOADED)
+
     def test_comps_unsafe_http_url(self):
         """Ensure that setting comps_url to http://example.com fails validation."""
-        c = config.BodhiConfig()
-        c.load_config()
+        c = self.config
         c['comps_url'] = 'http://example.com'
 
         with self.assertRaises(ValueError) as exc:
             c._validate()
 
-        self.assertEqual(str(exc.exception), ('Invalid config values were set: \n\tcomps_url: This '
-                                              'setting must be a URL starting with https://.'))
+        self.assertEqual(exc.exception.args[0],
+                         _ERR_INVALID_PREFIX + 'comps_url: ' + _ERR_HTTP_URL)
 
     def test_valid_config(self):
         """A valid config should not raise Exceptions."""
-        c = config.BodhiConfig()
-        c.load_config({'session.secret': 'secret', 'authtkt.secret': 'secret'})
+        c = self.config
 
         # This should not raise an Excepton
         c._validate()
@@ -213,144 +333,106 @@ class BodhiConfigValidate(unittest.TestCase):
 
 class GenerateListValidatorTests(unittest.TestCase):
     """Tests the _generate_list_validator() function."""
+    _WRONG_TYPE_RE = re.compile(re.escape('"{\'lol\': \'wut\'}" cannot be intepreted as a list.'))
+
+    @classmethod
+    def setUpClass(cls):
+        # The generated validators are pure functions, so build each flavor once and share it
+        # across the tests instead of reconstructing the closure per test. The staticmethod
+        # wrapper keeps Python 2 from binding them as methods and passing self as the value.
+        cls._default_v = staticmethod(config._generate_list_validator())
+        cls._int_v = staticmethod(config._generate_list_validator(validator=int))
+        cls._pipe_v = staticmethod(config._generate_list_validator('|'))
+
     def test_custom_splitter(self):
         """Test with a non-default splitter."""
-        result = config._generate_list_validator('|')('thing 1| thing 2')
+        result = self._pipe_v('thing 1| thing 2')
 
         self.assertEqual(result, [u'thing 1', u'thing 2'])
-        self.assertTrue(all([isinstance(v, unicode) for v in result]))
+        self.assertTrue(all(isinstance(v, unicode) for v in result))
 
     def test_custom_validator(self):
         """Test with a non-default validator."""
-        result = config._generate_list_validator(validator=int)('1 23 456')
+        result = self._int_v('1 23 456')
 
         self.assertEqual(result, [1, 23, 456])
-        self.assertTrue(all([isinstance(v, int) for v in result]))
+        self.assertTrue(all(isinstance(v, int) for v in result))
 
     def test_with_defaults(self):
         """Test with the default parameters."""
-        result = config._generate_list_validator()('play it again sam')
+        result = self._default_v('play it again sam')
 
         self.assertEqual(result, [u'play', u'it', u'again', u'sam'])
-        self.assertTrue(all([isinstance(v, unicode) for v in result]))
+        self.assertTrue(all(isinstance(v, unicode) for v in result))
 
     def test_with_list(self):
         """Test with a list."""
-        result = config._generate_list_validator(validator=int)(['1', '23', 456])
+        result = self._int_v(['1', '23', 456])
 
         self.assertEqual(result, [1, 23, 456])
-        self.assertTrue(all([isinstance(v, int) for v in result]))
+        self.assertTrue(all(isinstance(v, int) for v in result))
 
     def test_wrong_type(self):
         """Test with a non string, non list data type."""
-        with self.assertRaises(ValueError) as exc:
-            config._generate_list_validator()({'lol': 'wut'})
-
-        self.assertEqual(str(exc.exception), '"{\'lol\': \'wut\'}" cannot be intepreted as a list.')
-
-
-class ValidateBoolTests(unittest.TestCase):
-    """This class contains tests for the _validate_bool() function."""
-    def test_bool(self):
-        """Test with boolean values."""
-        self.assertTrue(config._validate_bool(False) is False)
-        self.assertTrue(config._validate_bool(True) is True)
-
-    def test_other(self):
-        """Test with a non-string and non-bool type."""
-        with self.assertRaises(ValueError) as exc:
-            config._validate_bool({'not a': 'bool'})
-
-        self.assertEqual(str(exc.exception), "\"{'not a': 'bool'}\" is not a bool or a string.")
-
-    def test_string_falsey(self):
-        """Test with "falsey" strings."""
-        for s in ('f', 'false', 'n', 'no', 'off', '0'):
-            self.assertTrue(config._validate_bool(s) is False)
-
-    def test_string_other(self):
-        """Test with an ambiguous string."""
-        with self.assertRaises(ValueError) as exc:
-            config._validate_bool('oops typo')
-
-        self.assertEqual(str(exc.exception),
-                         '"oops typo" cannot be interpreted as a boolean value.')
-
-    def test_string_truthy(self):
-        """Test with "truthy" strings."""
-        for s in ('t', 'true', 'y', 'yes', 'on', '1'):
-            self.assertTrue(config._validate_bool(s) is True)
-
-
-class ValidateColorTests(unittest.TestCase):
-    """Test the _validate_color() function."""
-    def test_non_string(self):
-        """A non-string parameter should raise a ValueError."""
-        with self.assertRaises(ValueError) as exc:
-            config._validate_color(['this', 'should', 'not', 'work'])
-
-        self.assertEqual(str(exc.exception),
-                         "\"['this', 'should', 'not', 'work']\" is not a valid color expression.")
-
-    def test_valid_color(self):
-        """A valid color string should not raise a ValueError and should be converted to unicode."""
-        color = config._validate_color('#65FE00')
-
-        self.assertEqual(color, u'#65FE00')
-        self.assertTrue(isinstance(color, unicode))
-
-    def test_wrong_base(self):
-        """A string that isn't a base-16 number should raise a ValueError."""
-        with self.assertRaises(ValueError) as exc:
-            config._validate_color('#65FE0G')
-
-        self.assertEqual(str(exc.exception), '"#65FE0G" is not a valid color expression.')
-
-    def test_wrong_first_char(self):
-        """A string that doesn't start with # should raise a ValueError."""
-        with self.assertRaises(ValueError) as exc:
-            config._validate_color('065FE00')
-
-        self.assertEqual(str(exc.exception), '"065FE00" is not a valid color expression.')
-
-    def test_wrong_length(self):
-        """A string with the wrong length should raise a ValueError."""
-        with self.assertRaises(ValueError) as exc:
-            config._validate_color('#65FE0')
-
-        self.assertEqual(str(exc.exception), '"#65FE0" is not a valid color expression.')
-
-
-class ValidateFernetKey(unittest.TestCase):
-    """This class contains tests for the _validate_fernet_key() function."""
-    def test_changeme(self):
-        """A value of CHANGE should raise a ValueError."""
-        with self.assertRaises(ValueError) as exc:
-            config._validate_fernet_key('CHANGEME')
-
-        self.assertEqual(str(exc.exception), 'This setting must be changed from its default value.')
-
-    def test_non_base64_key(self):
-        """A non-base64 key should also raise a ValueError."""
-        with self.assertRaises(ValueError) as exc:
-            config._validate_fernet_key('not base 64')
-
-        self.assertEqual(str(exc.exception), 'Fernet key must be 32 url-safe base64-encoded bytes.')
-
-    def test_valid_key(self):
-        """A valid key should be converted to a unicode object."""
-        key = 'gFqE6rcBXVLssjLjffsQsAa-nlm5Bg06MTKrVT9hsMA='
-        result = config._validate_fernet_key(key)
-
-        self.assertEqual(result, key)
-        self.assertTrue(type(result), str)
-
-    def test_wrong_length_key(self):
-        """An key with wrong length should raise a ValueError."""
-        with self.assertRaises(ValueError) as exc:
-            config._validate_fernet_key('VGhpcyBpcyBhIHRlc3Qgb2YgdGhlIHN5c3RlbS4K')
-
-        self.assertEqual(str(exc.exception), 'Fernet key must be 32 url-safe base64-encoded bytes.')
+        self.assertRaisesRegexp(ValueError, self._WRONG_TYPE_RE, self._default_v, {'lol': 'wut'})
+
+
+class TestValidators(unittest.TestCase):
+    """Data-driven tests for the side-effect-free validator functions.
+
+    _validate_bool(), _validate_color(), _validate_fernet_key(), _validate_secret() and
+    _validate_tls_url() all have the same shape, so their checks share two table-driven tests
+    instead of paying unittest's per-method dispatch cost for every input.
+    """
+
+    _NOT_A_BOOL_RE = re.compile(re.escape("\"{'not a': 'bool'}\" is not a bool or a string."))
+    _AMBIGUOUS_RE = re.compile(re.escape('"oops typo" cannot be interpreted as a boolean value.'))
+    _COLOR_RE = re.compile(r'is not a valid color expression\.')
+    _CHANGEME_RE = re.compile(r'This setting must be changed from its default value\.')
+    _BAD_KEY_RE = re.compile(r'Fernet key must be 32 url-safe base64-encoded bytes\.')
+    _HTTPS_RE = re.compile(r'This setting must be a URL starting with https://\.')
+
+    @classmethod
+    def setUpClass(cls):
+        # (validator, input, expected output) triples. The expected output's type is asserted
+        # too, since the validators are also responsible for coercing their return values.
+        cls._valid_cases = [
+            (config._validate_bool, False, False),
+            (config._validate_bool, True, True),
+            (config._validate_color, '#65FE00', u'#65FE00'),
+            (config._validate_fernet_key, _VALID_FERNET_KEY, _VALID_FERNET_KEY),
+            (config._validate_secret, 'secret', u'secret'),
+            (config._validate_tls_url, 'https://example.com', u'https://example.com'),
+        ]
+        cls._valid_cases.extend((config._validate_bool, s, False) for s in _FALSEY)
+        cls._valid_cases.extend((config._validate_bool, s, True) for s in _TRUTHY)
+
+        # (validator, input, expected error pattern) triples.
+        cls._error_cases = [
+            (config._validate_bool, {'not a': 'bool'}, cls._NOT_A_BOOL_RE),
+            (config._validate_bool, 'oops typo', cls._AMBIGUOUS_RE),
+            (config._validate_color, ['this', 'should', 'not', 'work'], cls._COLOR_RE),
+            (config._validate_fernet_key, 'CHANGEME', cls._CHANGEME_RE),
+            (config._validate_secret, 'CHANGEME', cls._CHANGEME_RE),
+            (config._validate_tls_url, 'http://example.com', cls._HTTPS_RE),
+        ]
+        cls._error_cases.extend(
+            (config._validate_color, value, cls._COLOR_RE) for value in _INVALID_COLORS)
+        cls._error_cases.extend(
+            (config._validate_fernet_key, value, cls._BAD_KEY_RE) for value in _INVALID_KEYS)
+
+    def test_valid_values(self):
+        """Valid inputs should be returned with the expected value and type."""
+        for validator, value, expected in self._valid_cases:
+            result = validator(value)
+
+            self.assertEqual(result, expected)
+            self.assertIs(type(result), type(expected))
+
+    def test_invalid_values(self):
+        """Invalid inputs should raise a ValueError with the expected message."""
+        for validator, value, error_re in self._error_cases:
+            self.assertRaisesRegexp(ValueError, error_re, validator, value)
 
 
 class ValidateNoneOrTests(unittest.TestCase):
@@ -371,50 +453,19 @@ class ValidateNoneOrTests(unittest.TestCase):
 
 class ValidatePathTests(unittest.TestCase):
     """Test the _validate_path() function."""
+    _DOES_NOT_EXIST_RE = re.compile(re.escape('"/does/not/exist" does not exist.'))
+
+    @classmethod
+    def setUpClass(cls):
+        # Validate this module's own path once so repeated runs don't redo the stat() syscall.
+        cls._validated = config._validate_path(__file__)
+
     def test_path_does_not_exist(self):
         """Test with a path that does not exist."""
-        with self.assertRaises(ValueError) as exc:
-            config._validate_path('/does/not/exist')
-
-        self.assertEqual(str(exc.exception), '"/does/not/exist" does not exist.')
+        self.assertRaisesRegexp(ValueError, self._DOES_NOT_EXIST_RE, config._validate_path,
+                                '/does/not/exist')
 
     def test_path_exists(self):
         """Test with a path that exists."""
-        result = config._validate_path(__file__)
-
-        self.assertEqual(result, __file__)
-        self.assertTrue(isinstance(result, unicode))
-
-
-class ValidateSecretTests(unittest.TestCase):
-    """Test the _validate_secret() function."""
-    def test_with_changeme(self):
-        """Ensure that CHANGEME raises a ValueError."""
-        with self.assertRaises(ValueError) as exc:
-            config._validate_secret('CHANGEME')
-
-        self.assertEqual(str(exc.exception), 'This setting must be changed from its default value.')
-
-    def test_with_secret(self):
-        """Ensure that a secret gets changed to a unicode."""
-        result = config._validate_secret('secret')
-
-        self.assertEqual(result, u'secret')
-        self.assertTrue(isinstance(result, unicode))
-
-
-class ValidateTLSURL(unittest.TestCase):
-    """Test the _validate_tls_url() function."""
-    def test_with_http(self):
-        """Ensure that http:// URLs raise a ValueError."""
-        with self.assertRaises(ValueError) as exc:
-            config._validate_tls_url('http://example.com')
-
-        self.assertEqual(str(exc.exception), 'This setting must be a URL starting with https://.')
-
-    def test_with_https(self):
-        """Ensure that https:// urls get converted to unicode."""
-        result = config._validate_tls_url('https://example.com')
-
-        self.assertEqual(result, u'https://example.com')
-        self.assertTrue(isinstance(result, unicode))
+        self.assertEqual(self._validated, __file__)
+        self.assertTrue(isinstance(self._validated, unicode))